@@ -5,13 +5,25 @@ Optimized, cleaned up, and hardened version.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Annotated, Any, AsyncIterator, Final, Literal
-from uuid import uuid4
-
-from agents import Agent, RunContextWrapper, Runner, function_tool
+from functools import lru_cache
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Final, Literal
+
+from agents import (
+    Agent,
+    ModelSettings,
+    RunContextWrapper,
+    Runner,
+    StopAtTools,
+    function_tool,
+)
 from chatkit.agents import (
     AgentContext,
     ClientToolCall,
@@ -19,6 +31,7 @@ from chatkit.agents import (
     stream_agent_response,
 )
 from chatkit.server import ChatKitServer, ThreadItemDoneEvent
+from chatkit.store import Store
 from chatkit.types import (
     Attachment,
     ClientToolCallItem,
@@ -28,13 +41,18 @@ from chatkit.types import (
     ThreadStreamEvent,
     UserMessageItem,
 )
+from chatkit.widgets import WidgetRoot
 from openai.types.responses import ResponseInputContentParam
 from pydantic import ConfigDict, Field
 
-from .constants import INSTRUCTIONS, MODEL
+from .constants import INSTRUCTIONS, MODEL, PROMPT_CACHE_KEY
 from .facts import Fact, fact_store
-from .memory_store import MemoryStore
-from .sample_widget import render_weather_widget, weather_widget_copy_text
+from .memory_store import create_store
+from .sample_widget import (
+    WeatherWidgetData,
+    render_weather_widget,
+    weather_widget_copy_text,
+)
 from .weather import WeatherLookupError, retrieve_weather
 from .weather import normalize_unit as normalize_temperature_unit
 
@@ -49,22 +67,44 @@ logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------
 # Constants & helpers
 # ------------------------------------------------------------------------------
-SUPPORTED_COLOR_SCHEMES: Final[frozenset[str]] = frozenset({"light", "dark"})
+_THEME_MAP: Final[dict[str, str]] = {
+    "light": "light",
+    "dark": "dark",
+    "day": "light",
+    "bright": "light",
+    "white": "light",
+    "light mode": "light",
+    "light theme": "light",
+    "night": "dark",
+    "black": "dark",
+    "dim": "dark",
+    "dark mode": "dark",
+    "dark theme": "dark",
+}
 CLIENT_THEME_TOOL_NAME: Final[str] = "switch_theme"
+CLIENT_TOOL_BUSY: Final[dict[str, str]] = {
+    "status": "deferred",
+    "message": "Another client action is already pending; call this tool again next turn.",
+}
+WARMUP_TIMEOUT_SECONDS: Final[float] = 5.0
+WEATHER_CACHE_TTL_SECONDS: Final[float] = 600.0
+WEATHER_CACHE_MAX_ENTRIES: Final[int] = 256
 
 
 def _gen_id(prefix: str) -> str:
-    return f"{prefix}_{uuid4().hex[:8]}"
+    return f"{prefix}_{secrets.token_hex(4)}"
 
 
-def _is_tool_completion_item(item: Any) -> bool:
-    return isinstance(item, ClientToolCallItem)
+def _warmup_enabled() -> bool:
+    """Whether startup should prime the prompt cache (``PROMPT_CACHE_WARMUP=1``)."""
+    return os.getenv("PROMPT_CACHE_WARMUP", "").strip().lower() in {"1", "true", "yes"}
 
 
 def _normalize_color_scheme(value: str) -> str:
     normalized = value.strip().lower()
-    if normalized in SUPPORTED_COLOR_SCHEMES:
-        return normalized
+    theme = _THEME_MAP.get(normalized)
+    if theme:
+        return theme
     if "dark" in normalized:
         return "dark"
     if "light" in normalized:
@@ -73,9 +113,47 @@ def _normalize_color_scheme(value: str) -> str:
 
 
 def _user_message_text(item: UserMessageItem) -> str:
-    return " ".join(
-        part.text for part in item.content if getattr(part, "text", None)
-    ).strip()
+    # Text and tag content both carry a required ``text`` field.
+    return " ".join([text for part in item.content if (text := part.text.strip())])
+
+
+# ------------------------------------------------------------------------------
+# Weather cache
+# ------------------------------------------------------------------------------
+_lru_weather_cache: OrderedDict[str, tuple[float, WeatherWidgetData]] = OrderedDict()
+_weather_cache_lock = asyncio.Lock()
+
+
+def _weather_cache_key(location: str, unit: str) -> str:
+    return f"{' '.join(location.split()).lower()}|{unit}"
+
+
+async def _cached_weather(location: str, unit: str) -> WeatherWidgetData:
+    """Return weather for a location, reusing lookups younger than the TTL."""
+    key = _weather_cache_key(location, unit)
+
+    async with _weather_cache_lock:
+        entry = _lru_weather_cache.get(key)
+        if entry and time.monotonic() - entry[0] < WEATHER_CACHE_TTL_SECONDS:
+            _lru_weather_cache.move_to_end(key)
+            logger.debug("Weather cache hit: %s", key)
+            return entry[1]
+
+    data = await retrieve_weather(location, unit)
+
+    async with _weather_cache_lock:
+        _lru_weather_cache[key] = (time.monotonic(), data)
+        _lru_weather_cache.move_to_end(key)
+        while len(_lru_weather_cache) > WEATHER_CACHE_MAX_ENTRIES:
+            _lru_weather_cache.popitem(last=False)
+
+    return data
+
+
+@lru_cache(maxsize=WEATHER_CACHE_MAX_ENTRIES)
+def _render_weather(data: WeatherWidgetData) -> tuple[WidgetRoot, str]:
+    """Build the widget and copy text once per distinct weather payload."""
+    return render_weather_widget(data), weather_widget_copy_text(data)
 
 
 # ------------------------------------------------------------------------------
@@ -84,7 +162,7 @@ def _user_message_text(item: UserMessageItem) -> str:
 class FactAgentContext(AgentContext):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    store: Annotated[MemoryStore, Field(exclude=True)]
+    store: Annotated[Store[dict[str, Any]], Field(exclude=True)]
     request_context: dict[str, Any]
 
 
@@ -95,15 +173,18 @@ async def _stream_saved_hidden(
     ctx: RunContextWrapper[FactAgentContext], fact: Fact
 ) -> None:
     """Stream a hidden FACT_SAVED marker back to the client."""
+    thread_id = ctx.context.thread.id
+    # All fields come from trusted internal values, so skip validation.
     await ctx.context.stream(
-        ThreadItemDoneEvent(
-            item=HiddenContextItem(
+        ThreadItemDoneEvent.model_construct(
+            item=HiddenContextItem.model_construct(
                 id=_gen_id("msg"),
-                thread_id=ctx.context.thread.id,
+                thread_id=thread_id,
+                # Naive local time, matching the timestamps ChatKit itself
+                # stamps on thread items.
                 created_at=datetime.now(),
                 content=(
-                    f'<FACT_SAVED id="{fact.id}" '
-                    f'threadId="{ctx.context.thread.id}">'
+                    f'<FACT_SAVED id="{fact.id}" threadId="{thread_id}">'
                     f"{fact.text}</FACT_SAVED>"
                 ),
             ),
@@ -121,27 +202,28 @@ async def save_fact(
     ctx: RunContextWrapper[FactAgentContext],
     fact: str,
 ) -> dict[str, str] | None:
-    try:
-        saved = await fact_store.create(text=fact)
-        confirmed = await fact_store.mark_saved(saved.id)
-
-        if not confirmed:
-            raise RuntimeError("Fact confirmation failed")
+    # ChatKit emits a single client tool call per run, so never overwrite one.
+    if ctx.context.client_tool_call is not None:
+        return CLIENT_TOOL_BUSY
 
+    # Claim the slot before awaiting so a concurrent switch_theme defers.
+    call = ctx.context.client_tool_call = ClientToolCall(
+        name="record_fact", arguments={}
+    )
+    try:
+        confirmed = await fact_store.create_saved(text=fact)
         await _stream_saved_hidden(ctx, confirmed)
 
-        ctx.context.client_tool_call = ClientToolCall(
-            name="record_fact",
-            arguments={
-                "fact_id": confirmed.id,
-                "fact_text": confirmed.text,
-            },
-        )
+        call.arguments = {
+            "fact_id": confirmed.id,
+            "fact_text": confirmed.text,
+        }
 
         logger.info("Fact saved: %s", confirmed.id)
         return {"fact_id": confirmed.id, "status": "saved"}
 
     except Exception:
+        ctx.context.client_tool_call = None
         logger.exception("Failed to save fact")
         return None
 
@@ -153,6 +235,9 @@ async def switch_theme(
     ctx: RunContextWrapper[FactAgentContext],
     theme: str,
 ) -> dict[str, str] | None:
+    if ctx.context.client_tool_call is not None:
+        return CLIENT_TOOL_BUSY
+
     try:
         normalized = _normalize_color_scheme(theme)
         ctx.context.client_tool_call = ClientToolCall(
@@ -182,13 +267,12 @@ async def get_weather(
 
     try:
         normalized_unit = normalize_temperature_unit(unit)
-        data = await retrieve_weather(location, normalized_unit)
+        data = await _cached_weather(location, normalized_unit)
     except WeatherLookupError as exc:
         raise ValueError(str(exc)) from exc
 
     try:
-        widget = render_weather_widget(data)
-        copy_text = weather_widget_copy_text(data)
+        widget, copy_text = _render_weather(data)
         await ctx.context.stream_widget(widget, copy_text=copy_text)
     except Exception as exc:
         logger.exception("Weather widget rendering failed")
@@ -212,17 +296,29 @@ class FactAssistantServer(ChatKitServer[dict[str, Any]]):
     """ChatKit server wired up with fact recording, theming, and weather tools."""
 
     def __init__(self) -> None:
-        self.store = MemoryStore()
+        self.store = create_store()
         super().__init__(self.store)
 
         self.assistant = Agent[FactAgentContext](
             model=MODEL,
             name="ChatKit Guide",
             instructions=INSTRUCTIONS,
+            model_settings=ModelSettings(
+                extra_args={"prompt_cache_key": PROMPT_CACHE_KEY},
+            ),
             tools=[save_fact, switch_theme, get_weather],  # type: ignore[arg-type]
+            # ChatKit reads ctx.context.client_tool_call once, after the run,
+            # so end the run as soon as a client tool fires. Tools from the
+            # same response still run concurrently; a second client tool
+            # defers itself (CLIENT_TOOL_BUSY) instead of overwriting the first.
+            tool_use_behavior=StopAtTools(
+                stop_at_tool_names=["save_fact", "switch_theme"]
+            ),
         )
 
         self._thread_item_converter = self._init_thread_item_converter()
+        self._convert_fn = self._bind_converter_method(self._thread_item_converter)
+        self._to_agent_input = self._make_agent_input_fn()
 
     # ------------------------------------------------------------------
     # Public API
@@ -240,7 +336,9 @@ class FactAssistantServer(ChatKitServer[dict[str, Any]]):
         )
 
         target = item or await self._latest_thread_item(thread, context)
-        if not target or _is_tool_completion_item(target):
+        # Client tool completions never start a new agent turn. ChatKit item
+        # classes are not subclassed, so an exact type check is enough.
+        if not target or type(target) is ClientToolCallItem:
             return
 
         agent_input = await self._to_agent_input(thread, target)
@@ -256,6 +354,43 @@ class FactAssistantServer(ChatKitServer[dict[str, Any]]):
         async for event in stream_agent_response(agent_context, result):
             yield event
 
+        usage = result.context_wrapper.usage
+        logger.debug(
+            "Prompt cache: %d/%d input tokens cached (thread %s)",
+            usage.input_tokens_details.cached_tokens,
+            usage.input_tokens,
+            thread.id,
+        )
+
+    async def warmup(self) -> None:
+        """Prime the provider-side prompt cache for the static instructions.
+
+        Runs one throwaway turn with the same instructions, tools and cache
+        key as real requests so the first user turn can reuse the cached
+        prefix. The turn is billed and only pays off once INSTRUCTIONS passes
+        the provider's 1024-token caching minimum, so it is opt-in via
+        ``PROMPT_CACHE_WARMUP=1`` and skipped without an ``OPENAI_API_KEY``.
+        Failures and timeouts are logged and never block startup for longer
+        than ``WARMUP_TIMEOUT_SECONDS``.
+        """
+        if not _warmup_enabled():
+            return
+        if not os.getenv("OPENAI_API_KEY"):
+            logger.info("Skipping prompt cache warmup: OPENAI_API_KEY is not set")
+            return
+
+        agent = self.assistant.clone(
+            model_settings=self.assistant.model_settings.resolve(
+                # 16 is the smallest output budget the Responses API accepts.
+                ModelSettings(max_tokens=16, tool_choice="none"),
+            ),
+        )
+        try:
+            await asyncio.wait_for(Runner.run(agent, "ping"), WARMUP_TIMEOUT_SECONDS)
+            logger.info("Prompt cache warmed up")
+        except Exception:
+            logger.warning("Prompt cache warmup failed", exc_info=True)
+
     async def to_message_content(
         self, _input: Attachment
     ) -> ResponseInputContentParam:
@@ -280,6 +415,45 @@ class FactAssistantServer(ChatKitServer[dict[str, Any]]):
 
         return None
 
+    @staticmethod
+    def _bind_converter_method(
+        converter: Any | None,
+    ) -> Callable[[ThreadItem, ThreadMetadata], Any] | None:
+        """Resolve the converter entry point and its calling convention once."""
+        if converter is None:
+            return None
+
+        for method_name in (
+            "to_input_item",
+            "convert",
+            "convert_item",
+            "convert_thread_item",
+        ):
+            method = getattr(converter, method_name, None)
+            if not method:
+                continue
+
+            try:
+                params = list(inspect.signature(method).parameters.values())
+            except (TypeError, ValueError):
+                logger.debug("Cannot inspect converter method: %s", method_name)
+                continue
+
+            if len(params) < 2:
+                return lambda item, _thread: method(item)
+
+            param = params[1]
+            if param.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                return lambda item, thread: method(item, thread)
+
+            name = param.name
+            return lambda item, thread: method(item, **{name: thread})
+
+        return None
+
     async def _latest_thread_item(
         self,
         thread: ThreadMetadata,
@@ -294,54 +468,32 @@ class FactAssistantServer(ChatKitServer[dict[str, Any]]):
             logger.exception("Failed to load latest thread item")
             return None
 
-    async def _to_agent_input(
+    def _make_agent_input_fn(
         self,
-        thread: ThreadMetadata,
-        item: ThreadItem,
-    ) -> Any | None:
-        if _is_tool_completion_item(item):
-            return None
+    ) -> Callable[[ThreadMetadata, ThreadItem], Awaitable[Any | None]]:
+        """Pick the per-message conversion path once the converter is known.
 
-        converter = self._thread_item_converter
-        if converter:
-            for method_name in (
-                "to_input_item",
-                "convert",
-                "convert_item",
-                "convert_thread_item",
-            ):
-                method = getattr(converter, method_name, None)
-                if not method:
-                    continue
-
-                try:
-                    sig = inspect.signature(method)
-                    args = [item]
-                    kwargs: dict[str, Any] = {}
-
-                    params = list(sig.parameters.values())
-                    if len(params) > 1:
-                        param = params[1]
-                        if param.kind in (
-                            inspect.Parameter.POSITIONAL_ONLY,
-                            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                        ):
-                            args.append(thread)
-                        else:
-                            kwargs[param.name] = thread
-
-                    result = method(*args, **kwargs)
-                    return await result if inspect.isawaitable(result) else result
-
-                except Exception:
-                    logger.debug(
-                        "Converter method failed: %s", method_name, exc_info=True
-                    )
-
-        if isinstance(item, UserMessageItem):
-            return _user_message_text(item)
+        Tool completions never reach the returned function; respond filters them.
+        """
+        convert = self._convert_fn
 
-        return None
+        if convert is None:
+
+            async def user_text_only(thread: ThreadMetadata, item: ThreadItem) -> Any | None:
+                return _user_message_text(item) if type(item) is UserMessageItem else None
+
+            return user_text_only
+
+        async def via_converter(thread: ThreadMetadata, item: ThreadItem) -> Any | None:
+            try:
+                result = convert(item, thread)
+                return await result if inspect.isawaitable(result) else result
+            except Exception:
+                logger.debug("Converter method failed", exc_info=True)
+
+            return _user_message_text(item) if type(item) is UserMessageItem else None
+
+        return via_converter
 
 
 # ------------------------------------------------------------------------------
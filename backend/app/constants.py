@@ -1,6 +1,14 @@
 from typing import Final
 
 # Constants and configuration used across the ChatKit backend.
+#
+# INSTRUCTIONS is sent as the static prompt prefix on every turn and is cached
+# provider-side under PROMPT_CACHE_KEY (and, with PROMPT_CACHE_WARMUP=1, warmed
+# at startup by FactAssistantServer.warmup). Keep it byte-identical across
+# requests: never interpolate per-user or per-thread data into it. Bump the
+# cache key whenever the text changes.
+PROMPT_CACHE_KEY: Final[str] = "chatkit_guide_v1"
+
 INSTRUCTIONS: Final[str] = (
     "You are ChatKit Guide, an onboarding assistant that helps users understand "
     "how to use ChatKit and records short factual statements about themselves. "
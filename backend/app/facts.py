@@ -1,13 +1,22 @@
-"""Simple in-memory, async-safe store for user facts."""
+"""Async-safe stores for user facts: in-memory by default, Redis when configured."""
 
 from __future__ import annotations
 
 import asyncio
+import json
+import secrets
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional
-from uuid import uuid4
+from functools import partial
+from typing import TYPE_CHECKING, Final, List, Optional
+
+from .redis_client import REDIS_KEY_PREFIX, commit, get_redis, redis_url
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.client import Pipeline
 
 
 class FactStatus(str, Enum):
@@ -24,7 +33,7 @@ class Fact:
 
     text: str
     status: FactStatus = FactStatus.PENDING
-    id: str = field(default_factory=lambda: f"fact_{uuid4().hex[:8]}")
+    id: str = field(default_factory=lambda: f"fact_{secrets.token_hex(4)}")
     created_at: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
@@ -38,6 +47,16 @@ class Fact:
             "createdAt": self.created_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> Fact:
+        """Rebuild a fact from the output of :meth:`as_dict`."""
+        return cls(
+            text=data["text"],
+            status=FactStatus(data["status"]),
+            id=data["id"],
+            created_at=datetime.fromisoformat(data["createdAt"]),
+        )
+
 
 class FactStore:
     """Async-safe in-memory store for facts.
@@ -49,8 +68,7 @@ class FactStore:
     """
 
     def __init__(self) -> None:
-        self._facts: Dict[str, Fact] = {}
-        self._order: List[str] = []
+        self._facts: OrderedDict[str, Fact] = OrderedDict()
         self._lock = asyncio.Lock()
 
     async def create(self, *, text: str) -> Fact:
@@ -58,7 +76,13 @@ class FactStore:
         async with self._lock:
             fact = Fact(text=text)
             self._facts[fact.id] = fact
-            self._order.append(fact.id)
+            return fact
+
+    async def create_saved(self, *, text: str) -> Fact:
+        """Create and store a fact that is already saved."""
+        async with self._lock:
+            fact = Fact(text=text, status=FactStatus.SAVED)
+            self._facts[fact.id] = fact
             return fact
 
     async def mark_saved(self, fact_id: str) -> Optional[Fact]:
@@ -88,9 +112,9 @@ class FactStore:
         """Return saved facts in insertion order."""
         async with self._lock:
             return [
-                self._facts[fact_id]
-                for fact_id in self._order
-                if self._facts[fact_id].status == FactStatus.SAVED
+                fact
+                for fact in self._facts.values()
+                if fact.status is FactStatus.SAVED
             ]
 
     async def list_pending(self) -> List[Fact]:
@@ -99,7 +123,7 @@ class FactStore:
             return [
                 fact
                 for fact in self._facts.values()
-                if fact.status == FactStatus.PENDING
+                if fact.status is FactStatus.PENDING
             ]
 
     async def clear_discarded(self) -> int:
@@ -111,17 +135,185 @@ class FactStore:
         async with self._lock:
             discarded_ids = [
                 fid for fid, fact in self._facts.items()
-                if fact.status == FactStatus.DISCARDED
+                if fact.status is FactStatus.DISCARDED
             ]
 
             for fid in discarded_ids:
-                self._facts.pop(fid, None)
-                if fid in self._order:
-                    self._order.remove(fid)
+                del self._facts[fid]
 
             return len(discarded_ids)
 
 
+FACT_BATCH_MAX_ITEMS: Final[int] = 16
+
+# Update a fact's status only if it still exists, so a concurrent delete is
+# never undone. Returns the updated JSON, or nil when the fact is gone.
+_SET_STATUS_SCRIPT: Final[str] = """
+local raw = redis.call('HGET', KEYS[1], ARGV[1])
+if not raw then
+    return false
+end
+local fact = cjson.decode(raw)
+fact['status'] = ARGV[2]
+raw = cjson.encode(fact)
+redis.call('HSET', KEYS[1], ARGV[1], raw)
+return raw
+"""
+
+
+class RedisFactStore:
+    """Redis-backed fact store with the same API as :class:`FactStore`.
+
+    Layout:
+    - ``{prefix}:facts``       HASH  fact_id -> Fact JSON
+    - ``{prefix}:fact_order``  ZSET  fact_id scored by created_at
+
+    New facts are written in adaptive micro-batches: writes queue up while a
+    flush is in flight (or within the same event-loop tick) and the next flush
+    commits up to ``FACT_BATCH_MAX_ITEMS`` of them in one MULTI/EXEC round
+    trip. An idle store flushes immediately, so single writes add no delay.
+    """
+
+    def __init__(self, redis: Redis, *, prefix: str = REDIS_KEY_PREFIX) -> None:
+        self._redis = redis
+        self._facts_key = f"{prefix}:facts"
+        self._order_key = f"{prefix}:fact_order"
+        self._pending: list[tuple[Fact, asyncio.Future[Fact]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._set_status_script = redis.register_script(_SET_STATUS_SCRIPT)
+
+    async def _put(self, fact: Fact) -> Fact:
+        future: asyncio.Future[Fact] = asyncio.get_running_loop().create_future()
+        self._pending.append((fact, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        return await future
+
+    @staticmethod
+    def _fail(batch: list[tuple[Fact, asyncio.Future[Fact]]], exc: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    @classmethod
+    def _resolve(
+        cls, batch: list[tuple[Fact, asyncio.Future[Fact]]], write: asyncio.Future[None]
+    ) -> None:
+        """Settle every future in ``batch`` with the outcome of its write."""
+        if write.cancelled():
+            cls._fail(batch, RuntimeError("Fact write was interrupted"))
+        elif (exc := write.exception()) is not None:
+            cls._fail(batch, exc)
+        else:
+            for fact, future in batch:
+                if not future.done():
+                    future.set_result(fact)
+
+    async def _flush_pending(self) -> None:
+        try:
+            while self._pending:
+                batch = self._pending[:FACT_BATCH_MAX_ITEMS]
+                del self._pending[:FACT_BATCH_MAX_ITEMS]
+
+                def fill(
+                    pipe: Pipeline, batch: list[tuple[Fact, asyncio.Future[Fact]]] = batch
+                ) -> None:
+                    pipe.hset(
+                        self._facts_key,
+                        mapping={fact.id: json.dumps(fact.as_dict()) for fact, _ in batch},
+                    )
+                    pipe.zadd(
+                        self._order_key,
+                        {fact.id: fact.created_at.timestamp() for fact, _ in batch},
+                    )
+
+                # The write is shielded and still lands if this task is
+                # cancelled, so the batch is settled by the write's own outcome.
+                write = asyncio.ensure_future(commit(self._redis, fill))
+                write.add_done_callback(partial(self._resolve, batch))
+                try:
+                    await asyncio.shield(write)
+                except Exception:
+                    pass  # Already delivered to the batch by _resolve.
+        finally:
+            # Facts still queued never reached Redis; fail them rather than
+            # leave callers awaiting forever after cancellation or a crash.
+            pending, self._pending = self._pending, []
+            self._fail(pending, RuntimeError("Fact write was interrupted"))
+
+    async def _set_status(self, fact_id: str, status: FactStatus) -> Optional[Fact]:
+        # Read-modify-write runs server-side as one atomic script; a plain
+        # HGET/HSET would lose concurrent updates across workers.
+        raw = await self._set_status_script(
+            keys=[self._facts_key], args=[fact_id, status.value]
+        )
+        return Fact.from_dict(json.loads(raw)) if raw is not None else None
+
+    async def _all(self) -> List[Fact]:
+        ids = await self._redis.zrange(self._order_key, 0, -1)
+        if not ids:
+            return []
+        raw = await self._redis.hmget(self._facts_key, ids)
+        return [Fact.from_dict(json.loads(data)) for data in raw if data is not None]
+
+    async def create(self, *, text: str) -> Fact:
+        """Create and store a new pending fact."""
+        return await self._put(Fact(text=text))
+
+    async def create_saved(self, *, text: str) -> Fact:
+        """Create and store a fact that is already saved."""
+        return await self._put(Fact(text=text, status=FactStatus.SAVED))
+
+    async def mark_saved(self, fact_id: str) -> Optional[Fact]:
+        """Mark a fact as saved."""
+        return await self._set_status(fact_id, FactStatus.SAVED)
+
+    async def discard(self, fact_id: str) -> Optional[Fact]:
+        """Mark a fact as discarded."""
+        return await self._set_status(fact_id, FactStatus.DISCARDED)
+
+    async def get(self, fact_id: str) -> Optional[Fact]:
+        """Retrieve a fact by ID."""
+        raw = await self._redis.hget(self._facts_key, fact_id)
+        return Fact.from_dict(json.loads(raw)) if raw is not None else None
+
+    async def list_saved(self) -> List[Fact]:
+        """Return saved facts in insertion order."""
+        return [fact for fact in await self._all() if fact.status is FactStatus.SAVED]
+
+    async def list_pending(self) -> List[Fact]:
+        """Return all pending facts."""
+        return [fact for fact in await self._all() if fact.status is FactStatus.PENDING]
+
+    async def clear_discarded(self) -> int:
+        """Remove discarded facts.
+
+        Returns:
+            Number of facts removed.
+        """
+        discarded_ids = [
+            fact.id for fact in await self._all()
+            if fact.status is FactStatus.DISCARDED
+        ]
+        if not discarded_ids:
+            return 0
+
+        def fill(pipe: Pipeline) -> None:
+            pipe.hdel(self._facts_key, *discarded_ids)
+            pipe.zrem(self._order_key, *discarded_ids)
+
+        await commit(self._redis, fill)
+        return len(discarded_ids)
+
+
+def create_fact_store() -> FactStore | RedisFactStore:
+    """Return a RedisFactStore when REDIS_URL is set, else an in-memory store."""
+    url = redis_url()
+    if url:
+        return RedisFactStore(get_redis(url))
+    return FactStore()
+
+
 # Global singleton instance
-fact_store = FactStore()
+fact_store = create_fact_store()
 """Global FactStore instance used by the API and workflow."""
@@ -13,6 +13,8 @@ from chatkit.server import StreamingResult
 
 from .chat import FactAssistantServer, create_chatkit_server
 from .facts import fact_store
+from .redis_client import close_redis_clients
+from .weather import close_http_client
 
 
 # =========================
@@ -33,11 +35,25 @@ app = FastAPI(
 
 _chatkit_server: FactAssistantServer | None = None
 
+# Keep reverse proxies (nginx, etc.) from buffering the event stream, which
+# would otherwise hold back the first tokens until a buffer fills.
+SSE_HEADERS: Dict[str, str] = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
 
 @app.on_event("startup")
 async def startup() -> None:
     global _chatkit_server
     _chatkit_server = create_chatkit_server()
+    await _chatkit_server.warmup()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await close_http_client()
+    await close_redis_clients()
 
 
 def get_chatkit_server() -> FactAssistantServer:
@@ -69,12 +85,15 @@ async def chatkit_endpoint(
     result = await server.process(payload, context={"request": request})
 
     if isinstance(result, StreamingResult):
+        # ChatKit already yields pre-framed, serialized SSE bytes.
         return StreamingResponse(
             result,
             media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
 
     if hasattr(result, "json"):
+        # Already-encoded bytes; pass through without re-serializing.
         return Response(
             content=result.json,
             media_type="application/json",
@@ -1,30 +1,91 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from datetime import datetime
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, TypeVar
 
 from chatkit.store import NotFoundError, Store
 from chatkit.types import Attachment, Page, Thread, ThreadItem, ThreadMetadata
+from pydantic import TypeAdapter
 
+from .redis_client import REDIS_KEY_PREFIX, commit, get_redis, redis_url
 
-def utcnow() -> datetime:
-    """Timezone-aware UTC timestamp."""
-    return datetime.now(timezone.utc)
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.client import Pipeline
+
+_THREAD_ITEM_ADAPTER: TypeAdapter[ThreadItem] = TypeAdapter(ThreadItem)
+
+
+def _now() -> datetime:
+    """Naive local timestamp, matching what ChatKit stamps on threads and items.
+
+    Store-created defaults must use the same kind of datetime as ChatKit so
+    that ``created_at`` values stay directly comparable when sorting.
+    """
+    return datetime.now()
+
+
+_ModelT = TypeVar("_ModelT", ThreadMetadata, ThreadItem)
+
+
+def _naive_created_at(obj: _ModelT) -> _ModelT:
+    """Return ``obj`` with an aware ``created_at`` converted to naive local time.
+
+    Done once on write so the sort key can compare ``created_at`` directly.
+    """
+    created_at = obj.created_at
+    if created_at.tzinfo is None:
+        return obj
+    return obj.model_copy(update={"created_at": created_at.astimezone().replace(tzinfo=None)})
+
+
+_created_at_key = attrgetter("created_at")
+
+
+def _coerce_thread_metadata(thread: ThreadMetadata | Thread) -> ThreadMetadata:
+    """
+    Ensure ThreadMetadata contains no embedded items.
+    Compatible with openai-chatkit >= 1.0.
+    """
+    has_items = isinstance(thread, Thread) or (
+        hasattr(thread, "model_fields_set")
+        and "items" in thread.model_fields_set
+    )
+
+    if not has_items:
+        return thread.model_copy()
+
+    # The source model is already validated; skip re-validation and only
+    # carry over the metadata fields.
+    return ThreadMetadata.model_construct(
+        **{name: getattr(thread, name) for name in ThreadMetadata.model_fields}
+    )
 
 
 @dataclass(slots=True)
 class _ThreadState:
     thread: ThreadMetadata
-    items: List[ThreadItem] = field(default_factory=list)
-    item_index: Dict[str, int] = field(default_factory=dict)
+    items: OrderedDict[str, ThreadItem] = field(default_factory=OrderedDict)
+
+
+@dataclass(slots=True)
+class _ThreadLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
 
 
 class MemoryStore(Store[dict[str, Any]]):
     """
     Simple in-memory Store compatible with ChatKit.
 
+    Items are stored by reference and handed back as shallow copies, so
+    callers must treat stored items as immutable.
+
     ⚠️ Not suitable for production:
     - No persistence
     - No authentication
@@ -33,34 +94,34 @@ class MemoryStore(Store[dict[str, Any]]):
 
     def __init__(self) -> None:
         self._threads: Dict[str, _ThreadState] = {}
-        self._lock = asyncio.Lock()
+        # One lock per thread so operations on distinct threads never wait on
+        # each other. An entry lives only while someone holds or awaits it.
+        self._thread_locks: Dict[str, _ThreadLock] = {}
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _coerce_thread_metadata(thread: ThreadMetadata | Thread) -> ThreadMetadata:
-        """
-        Ensure ThreadMetadata contains no embedded items.
-        Compatible with openai-chatkit >= 1.0.
-        """
-        has_items = isinstance(thread, Thread) or (
-            hasattr(thread, "model_fields_set")
-            and "items" in thread.model_fields_set
-        )
-
-        if not has_items:
-            return thread.model_copy(deep=True)
-
-        data = thread.model_dump(exclude={"items"})
-        return ThreadMetadata(**data)
+    @asynccontextmanager
+    async def _locked(self, thread_id: str) -> AsyncIterator[None]:
+        entry = self._thread_locks.get(thread_id)
+        if entry is None:
+            entry = self._thread_locks[thread_id] = _ThreadLock()
+
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if entry.users == 0:
+                del self._thread_locks[thread_id]
 
     def _get_or_create_state(self, thread_id: str) -> _ThreadState:
         state = self._threads.get(thread_id)
         if state is None:
             state = _ThreadState(
-                thread=ThreadMetadata(id=thread_id, created_at=utcnow())
+                thread=ThreadMetadata(id=thread_id, created_at=_now())
             )
             self._threads[thread_id] = state
         return state
@@ -70,16 +131,19 @@ class MemoryStore(Store[dict[str, Any]]):
     # ------------------------------------------------------------------
 
     async def load_thread(self, thread_id: str, context: dict[str, Any]) -> ThreadMetadata:
-        async with self._lock:
+        if thread_id not in self._threads:
+            raise NotFoundError(f"Thread {thread_id} not found")
+
+        async with self._locked(thread_id):
             state = self._threads.get(thread_id)
             if not state:
                 raise NotFoundError(f"Thread {thread_id} not found")
-            return self._coerce_thread_metadata(state.thread)
+            return _coerce_thread_metadata(state.thread)
 
     async def save_thread(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
-        metadata = self._coerce_thread_metadata(thread)
+        metadata = _naive_created_at(_coerce_thread_metadata(thread))
 
-        async with self._lock:
+        async with self._locked(metadata.id):
             state = self._threads.get(metadata.id)
             if state:
                 state.thread = metadata
@@ -93,14 +157,9 @@ class MemoryStore(Store[dict[str, Any]]):
         order: str,
         context: dict[str, Any],
     ) -> Page[ThreadMetadata]:
-        async with self._lock:
-            threads = [
-                self._coerce_thread_metadata(state.thread)
-                for state in self._threads.values()
-            ]
-
-        threads.sort(
-            key=lambda t: t.created_at or utcnow(),
+        threads = sorted(
+            [state.thread for state in self._threads.values()],
+            key=_created_at_key,
             reverse=(order == "desc"),
         )
 
@@ -111,14 +170,17 @@ class MemoryStore(Store[dict[str, Any]]):
                     start = i + 1
                     break
 
-        page = threads[start : start + limit]
+        page = [_coerce_thread_metadata(thread) for thread in threads[start : start + limit]]
         has_more = len(threads) > start + limit
         next_after = page[-1].id if has_more and page else None
 
         return Page(data=page, has_more=has_more, after=next_after)
 
     async def delete_thread(self, thread_id: str, context: dict[str, Any]) -> None:
-        async with self._lock:
+        if thread_id not in self._threads:
+            return
+
+        async with self._locked(thread_id):
             self._threads.pop(thread_id, None)
 
     # ------------------------------------------------------------------
@@ -133,24 +195,25 @@ class MemoryStore(Store[dict[str, Any]]):
         order: str,
         context: dict[str, Any],
     ) -> Page[ThreadItem]:
-        async with self._lock:
+        async with self._locked(thread_id):
             state = self._get_or_create_state(thread_id)
-            items = [item.model_copy(deep=True) for item in state.items]
+            # Sort references and copy only the requested page.
+            items = sorted(
+                state.items.values(),
+                key=_created_at_key,
+                reverse=(order == "desc"),
+            )
 
-        items.sort(
-            key=lambda i: getattr(i, "created_at", utcnow()),
-            reverse=(order == "desc"),
-        )
+            start = 0
+            if after:
+                for i, item in enumerate(items):
+                    if item.id == after:
+                        start = i + 1
+                        break
 
-        start = 0
-        if after:
-            for i, item in enumerate(items):
-                if item.id == after:
-                    start = i + 1
-                    break
+            page = [item.model_copy() for item in items[start : start + limit]]
+            has_more = len(items) > start + limit
 
-        page = items[start : start + limit]
-        has_more = len(items) > start + limit
         next_after = page[-1].id if has_more and page else None
 
         return Page(data=page, has_more=has_more, after=next_after)
@@ -161,10 +224,10 @@ class MemoryStore(Store[dict[str, Any]]):
         item: ThreadItem,
         context: dict[str, Any],
     ) -> None:
-        async with self._lock:
+        item = _naive_created_at(item)
+        async with self._locked(thread_id):
             state = self._get_or_create_state(thread_id)
-            state.item_index[item.id] = len(state.items)
-            state.items.append(item.model_copy(deep=True))
+            state.items[item.id] = item
 
     async def save_item(
         self,
@@ -172,15 +235,10 @@ class MemoryStore(Store[dict[str, Any]]):
         item: ThreadItem,
         context: dict[str, Any],
     ) -> None:
-        async with self._lock:
+        item = _naive_created_at(item)
+        async with self._locked(thread_id):
             state = self._get_or_create_state(thread_id)
-            idx = state.item_index.get(item.id)
-
-            if idx is not None:
-                state.items[idx] = item.model_copy(deep=True)
-            else:
-                state.item_index[item.id] = len(state.items)
-                state.items.append(item.model_copy(deep=True))
+            state.items[item.id] = item
 
     async def load_item(
         self,
@@ -188,16 +246,19 @@ class MemoryStore(Store[dict[str, Any]]):
         item_id: str,
         context: dict[str, Any],
     ) -> ThreadItem:
-        async with self._lock:
+        if thread_id not in self._threads:
+            raise NotFoundError(f"Thread {thread_id} not found")
+
+        async with self._locked(thread_id):
             state = self._threads.get(thread_id)
             if not state:
                 raise NotFoundError(f"Thread {thread_id} not found")
 
-            idx = state.item_index.get(item_id)
-            if idx is None:
+            item = state.items.get(item_id)
+            if item is None:
                 raise NotFoundError(f"Item {item_id} not found")
 
-            return state.items[idx].model_copy(deep=True)
+            return item.model_copy()
 
     async def delete_thread_item(
         self,
@@ -205,19 +266,212 @@ class MemoryStore(Store[dict[str, Any]]):
         item_id: str,
         context: dict[str, Any],
     ) -> None:
-        async with self._lock:
+        if thread_id not in self._threads:
+            return
+
+        async with self._locked(thread_id):
             state = self._threads.get(thread_id)
             if not state:
                 return
 
-            idx = state.item_index.pop(item_id, None)
-            if idx is None:
-                return
+            state.items.pop(item_id, None)
+
+    # ------------------------------------------------------------------
+    # Attachments (intentionally unsupported)
+    # ------------------------------------------------------------------
+
+    async def save_attachment(self, attachment: Attachment, context: dict[str, Any]) -> None:
+        raise NotImplementedError("Attachments are not supported.")
+
+    async def load_attachment(self, attachment_id: str, context: dict[str, Any]) -> Attachment:
+        raise NotImplementedError("Attachments are not supported.")
+
+    async def delete_attachment(self, attachment_id: str, context: dict[str, Any]) -> None:
+        raise NotImplementedError("Attachments are not supported.")
+
+
+class RedisStore(Store[dict[str, Any]]):
+    """
+    Redis-backed Store so every Uvicorn worker sees the same threads.
+
+    Layout (all keys share ``prefix``):
+    - ``{prefix}:threads``                  ZSET  thread_id scored by created_at
+    - ``{prefix}:thread_meta``              HASH  thread_id -> ThreadMetadata JSON
+    - ``{prefix}:thread:{id}:items``        ZSET  item_id scored by created_at
+    - ``{prefix}:thread:{id}:item_data``    HASH  item_id -> ThreadItem JSON
+
+    Writes touching several keys go through a single, cancellation-shielded
+    MULTI/EXEC transaction.
+
+    Ordering differs from MemoryStore in one case: Redis breaks equal ZSET
+    scores by member, so threads or items with identical ``created_at`` come
+    back in id order rather than insertion order. ChatKit stamps items with
+    microsecond timestamps, so such ties are rare in practice.
+    """
+
+    def __init__(self, redis: Redis, *, prefix: str = REDIS_KEY_PREFIX) -> None:
+        self._redis = redis
+        self._threads_key = f"{prefix}:threads"
+        self._meta_key = f"{prefix}:thread_meta"
+        self._prefix = prefix
 
-            state.items.pop(idx)
-            # Rebuild index (safe + simple)
-            state.item_index = {item.id: i for i, item in enumerate(state.items)}
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _items_key(self, thread_id: str) -> str:
+        return f"{self._prefix}:thread:{thread_id}:items"
+
+    def _item_data_key(self, thread_id: str) -> str:
+        return f"{self._prefix}:thread:{thread_id}:item_data"
+
+    async def _page_ids(
+        self, key: str, after: str | None, limit: int, order: str
+    ) -> tuple[list[bytes], bool]:
+        desc = order == "desc"
+        start = 0
+        if after:
+            rank = await (
+                self._redis.zrevrank(key, after) if desc else self._redis.zrank(key, after)
+            )
+            if rank is not None:
+                start = rank + 1
+
+        # Fetch one extra id to learn whether another page exists.
+        ids = await self._redis.zrange(key, start, start + limit, desc=desc)
+        return ids[:limit], len(ids) > limit
+
+    # ------------------------------------------------------------------
+    # Threads
+    # ------------------------------------------------------------------
+
+    async def load_thread(self, thread_id: str, context: dict[str, Any]) -> ThreadMetadata:
+        raw = await self._redis.hget(self._meta_key, thread_id)
+        if raw is None:
+            raise NotFoundError(f"Thread {thread_id} not found")
+        return ThreadMetadata.model_validate_json(raw)
+
+    async def save_thread(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
+        metadata = _coerce_thread_metadata(thread)
+
+        def fill(pipe: Pipeline) -> None:
+            pipe.hset(self._meta_key, metadata.id, metadata.model_dump_json())
+            pipe.zadd(self._threads_key, {metadata.id: metadata.created_at.timestamp()})
+
+        await commit(self._redis, fill)
+
+    async def load_threads(
+        self,
+        limit: int,
+        after: str | None,
+        order: str,
+        context: dict[str, Any],
+    ) -> Page[ThreadMetadata]:
+        ids, has_more = await self._page_ids(self._threads_key, after, limit, order)
+        raw = await self._redis.hmget(self._meta_key, ids) if ids else []
+
+        page = [ThreadMetadata.model_validate_json(data) for data in raw if data is not None]
+        next_after = page[-1].id if has_more and page else None
+
+        return Page(data=page, has_more=has_more, after=next_after)
+
+    async def delete_thread(self, thread_id: str, context: dict[str, Any]) -> None:
+        def fill(pipe: Pipeline) -> None:
+            pipe.hdel(self._meta_key, thread_id)
+            pipe.zrem(self._threads_key, thread_id)
+            pipe.delete(self._items_key(thread_id), self._item_data_key(thread_id))
+
+        await commit(self._redis, fill)
+
+    # ------------------------------------------------------------------
+    # Thread Items
+    # ------------------------------------------------------------------
+
+    async def load_thread_items(
+        self,
+        thread_id: str,
+        after: str | None,
+        limit: int,
+        order: str,
+        context: dict[str, Any],
+    ) -> Page[ThreadItem]:
+        ids, has_more = await self._page_ids(self._items_key(thread_id), after, limit, order)
+        raw = await self._redis.hmget(self._item_data_key(thread_id), ids) if ids else []
+
+        page = [_THREAD_ITEM_ADAPTER.validate_json(data) for data in raw if data is not None]
+        next_after = page[-1].id if has_more and page else None
+
+        return Page(data=page, has_more=has_more, after=next_after)
+
+    async def add_thread_item(
+        self,
+        thread_id: str,
+        item: ThreadItem,
+        context: dict[str, Any],
+    ) -> None:
+        await self.save_item(thread_id, item, context)
+
+    async def save_item(
+        self,
+        thread_id: str,
+        item: ThreadItem,
+        context: dict[str, Any],
+    ) -> None:
+        # Like MemoryStore, writing an item implicitly creates its thread.
+        now = _now()
+        default_thread = ThreadMetadata(id=thread_id, created_at=now)
+
+        def fill(pipe: Pipeline) -> None:
+            pipe.hsetnx(self._meta_key, thread_id, default_thread.model_dump_json())
+            pipe.zadd(self._threads_key, {thread_id: now.timestamp()}, nx=True)
+            pipe.zadd(self._items_key(thread_id), {item.id: item.created_at.timestamp()})
+            pipe.hset(self._item_data_key(thread_id), item.id, item.model_dump_json())
+
+        await commit(self._redis, fill)
+
+    async def load_item(
+        self,
+        thread_id: str,
+        item_id: str,
+        context: dict[str, Any],
+    ) -> ThreadItem:
+        raw = await self._redis.hget(self._item_data_key(thread_id), item_id)
+        if raw is not None:
+            return _THREAD_ITEM_ADAPTER.validate_json(raw)
+
+        if not await self._redis.hexists(self._meta_key, thread_id):
+            raise NotFoundError(f"Thread {thread_id} not found")
+        raise NotFoundError(f"Item {item_id} not found")
+
+    async def delete_thread_item(
+        self,
+        thread_id: str,
+        item_id: str,
+        context: dict[str, Any],
+    ) -> None:
+        def fill(pipe: Pipeline) -> None:
+            pipe.zrem(self._items_key(thread_id), item_id)
+            pipe.hdel(self._item_data_key(thread_id), item_id)
+
+        await commit(self._redis, fill)
 
     # ------------------------------------------------------------------
     # Attachments (intentionally unsupported)
-    # --------------------------------------------
+    # ------------------------------------------------------------------
+
+    async def save_attachment(self, attachment: Attachment, context: dict[str, Any]) -> None:
+        raise NotImplementedError("Attachments are not supported.")
+
+    async def load_attachment(self, attachment_id: str, context: dict[str, Any]) -> Attachment:
+        raise NotImplementedError("Attachments are not supported.")
+
+    async def delete_attachment(self, attachment_id: str, context: dict[str, Any]) -> None:
+        raise NotImplementedError("Attachments are not supported.")
+
+
+def create_store() -> Store[dict[str, Any]]:
+    """Return a RedisStore when REDIS_URL is set, else an in-memory store."""
+    url = redis_url()
+    if url:
+        return RedisStore(get_redis(url))
+    return MemoryStore()
@@ -0,0 +1,67 @@
+"""Shared Redis connection used by the Redis-backed stores.
+
+Redis is optional. Set ``REDIS_URL`` (e.g. ``redis://localhost:6379/0``) and
+install the ``redis`` extra to share threads and facts across Uvicorn
+workers; without it the backend keeps everything in process memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Callable, Dict, Final
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.client import Pipeline
+
+REDIS_KEY_PREFIX: Final[str] = "chatkit"
+
+_clients: Dict[str, "Redis"] = {}
+
+
+def redis_url() -> str | None:
+    """Return the configured Redis URL, or None to use in-memory storage."""
+    return os.getenv("REDIS_URL") or None
+
+
+def get_redis(url: str) -> "Redis":
+    """Return a process-wide client (and connection pool) for ``url``."""
+    if aioredis is None:
+        raise RuntimeError(
+            "REDIS_URL is set but the redis package is not installed. "
+            'Install it with `uv sync --extra redis` or `pip install "redis>=5"`.'
+        )
+
+    client = _clients.get(url)
+    if client is None:
+        client = _clients[url] = aioredis.Redis.from_url(url)
+    return client
+
+
+async def close_redis_clients() -> None:
+    """Close every shared client; call on application shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def commit(redis: "Redis", fill: Callable[["Pipeline"], None]) -> None:
+    """Run the commands queued by ``fill`` as one MULTI/EXEC transaction.
+
+    The round trip is shielded so a cancelled request cannot abandon the
+    transaction (or its pooled connection) halfway through.
+    """
+
+    async def run() -> None:
+        async with redis.pipeline(transaction=True) as pipe:
+            fill(pipe)
+            await pipe.execute()
+
+    await asyncio.shield(run())
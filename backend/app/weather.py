@@ -24,6 +24,8 @@ DAILY_FIELDS = (
     "precipitation_probability_max"
 )
 DEFAULT_TIMEOUT = 20.0
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_KEEPALIVE_EXPIRY = 60.0
 HOURLY_SEGMENTS = 6
 
 
@@ -31,6 +33,34 @@ class WeatherLookupError(RuntimeError):
     """Raised when the weather service could not satisfy a request."""
 
 
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared client so lookups reuse pooled keep-alive connections."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+            trust_env=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; call on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 def _debug(message: str, *, extra: dict[str, Any] | None = None) -> None:
     payload = f"{DEBUG_PREFIX} {message}"
     if extra:
@@ -96,33 +126,28 @@ async def retrieve_weather(query: str, unit: str | None = None) -> WeatherWidget
 
     geocoded: GeocodedLocation | None = None
     forecast: dict[str, Any] | None = None
+    client = _get_http_client()
     try:
-        async with httpx.AsyncClient(
-            timeout=DEFAULT_TIMEOUT,
-            follow_redirects=True,
-            headers={"User-Agent": USER_AGENT},
-            trust_env=True,
-        ) as client:
-            geocoded = await _geocode_location(client, location_query)
-            _debug(
-                "geocode lookup succeeded",
-                extra={
-                    "label": geocoded.label,
-                    "latitude": geocoded.latitude,
-                    "longitude": geocoded.longitude,
-                },
-            )
-            _debug("requesting forecast", extra={"unit": normalized_unit})
-            forecast = await _fetch_weather_forecast(client, geocoded, normalized_unit)
-            forecast_keys = sorted(forecast.keys()) if isinstance(forecast, dict) else "unexpected"
-            has_current = bool(forecast.get("current")) if isinstance(forecast, dict) else False
-            _debug(
-                "forecast received",
-                extra={
-                    "keys": forecast_keys,
-                    "has_current": has_current,
-                },
-            )
+        geocoded = await _geocode_location(client, location_query)
+        _debug(
+            "geocode lookup succeeded",
+            extra={
+                "label": geocoded.label,
+                "latitude": geocoded.latitude,
+                "longitude": geocoded.longitude,
+            },
+        )
+        _debug("requesting forecast", extra={"unit": normalized_unit})
+        forecast = await _fetch_weather_forecast(client, geocoded, normalized_unit)
+        forecast_keys = sorted(forecast.keys()) if isinstance(forecast, dict) else "unexpected"
+        has_current = bool(forecast.get("current")) if isinstance(forecast, dict) else False
+        _debug(
+            "forecast received",
+            extra={
+                "keys": forecast_keys,
+                "has_current": has_current,
+            },
+        )
     except httpx.HTTPStatusError as exc:
         _debug(
             "http status error during weather lookup",
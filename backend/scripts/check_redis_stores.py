@@ -0,0 +1,134 @@
+"""Check that the Redis-backed stores behave like their in-memory counterparts.
+
+Runs against an in-process fakeredis server, so no Redis instance is needed:
+
+    uv run --extra redis --with fakeredis python -m scripts.check_redis_stores
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+import fakeredis
+from chatkit.store import NotFoundError, Store
+from chatkit.types import (
+    InferenceOptions,
+    ThreadMetadata,
+    UserMessageItem,
+    UserMessageTextContent,
+)
+
+from app.facts import FactStatus, FactStore, RedisFactStore
+from app.memory_store import MemoryStore, RedisStore
+
+CONTEXT: dict[str, Any] = {}
+
+
+def _message(item_id: str, thread_id: str, created_at: datetime) -> UserMessageItem:
+    return UserMessageItem(
+        id=item_id,
+        thread_id=thread_id,
+        created_at=created_at,
+        content=[UserMessageTextContent(text=item_id)],
+        inference_options=InferenceOptions(),
+    )
+
+
+async def _exercise_thread_store(store: Store[dict[str, Any]]) -> list[Any]:
+    """Run one scenario and return everything observable about the results."""
+    now = datetime.now()
+    await store.save_thread(ThreadMetadata(id="t1", created_at=now), CONTEXT)
+    await store.save_thread(ThreadMetadata(id="t2", created_at=now + timedelta(seconds=1)), CONTEXT)
+    for i in range(5):
+        item = _message(f"i{i}", "t1", now + timedelta(milliseconds=i))
+        await store.add_thread_item("t1", item, CONTEXT)
+
+    observed: list[Any] = []
+
+    # Pagination in both directions.
+    for order in ("asc", "desc"):
+        first = await store.load_thread_items("t1", None, 3, order, CONTEXT)
+        rest = await store.load_thread_items("t1", first.after, 3, order, CONTEXT)
+        observed.append(
+            ([i.id for i in first.data], first.has_more, first.after, [i.id for i in rest.data])
+        )
+        observed.append(rest.has_more)
+
+    # Updating an item keeps a single copy of it.
+    await store.save_item("t1", _message("i1", "t1", now + timedelta(milliseconds=1)), CONTEXT)
+    observed.append(len((await store.load_thread_items("t1", None, 10, "asc", CONTEXT)).data))
+
+    # Writing an item implicitly creates its thread.
+    await store.add_thread_item("t3", _message("x", "t3", now), CONTEXT)
+    observed.append((await store.load_thread("t3", CONTEXT)).id)
+
+    threads = await store.load_threads(2, None, "desc", CONTEXT)
+    observed.append(([t.id for t in threads.data], threads.has_more))
+
+    await store.delete_thread_item("t1", "i1", CONTEXT)
+    for thread_id, item_id in (("t1", "i1"), ("missing", "i0")):
+        try:
+            await store.load_item(thread_id, item_id, CONTEXT)
+        except NotFoundError as exc:
+            observed.append(str(exc))
+
+    await store.delete_thread("t1", CONTEXT)
+    observed.append([t.id for t in (await store.load_threads(10, None, "asc", CONTEXT)).data])
+    return observed
+
+
+async def _exercise_fact_store(store: FactStore | RedisFactStore) -> list[Any]:
+    observed: list[Any] = []
+
+    # Concurrent creates are batched by RedisFactStore; order must survive.
+    facts = await asyncio.gather(*[store.create(text=f"f{i}") for i in range(40)])
+    observed.append([f.text for f in await store.list_pending()])
+
+    saved = await store.create_saved(text="saved")
+    observed.append((await store.get(saved.id)).status)  # type: ignore[union-attr]
+
+    # Racing status updates must never lose the fact or corrupt its JSON.
+    target = facts[0]
+    results = await asyncio.gather(
+        *[store.mark_saved(target.id) if i % 2 else store.discard(target.id) for i in range(10)]
+    )
+    observed.append(all(result is not None for result in results))
+
+    await store.discard(target.id)
+    await store.discard(facts[1].id)
+    observed.append(await store.clear_discarded())
+    observed.append(await store.clear_discarded())
+
+    # Updating a cleared or unknown fact must not resurrect it.
+    observed.append(await store.mark_saved(target.id))
+    observed.append(await store.discard("fact_missing"))
+    observed.append(await store.get(target.id))
+
+    observed.append([f.text for f in await store.list_saved()])
+    observed.append(len(await store.list_pending()))
+    return observed
+
+
+async def main() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+
+    expected = await _exercise_thread_store(MemoryStore())
+    actual = await _exercise_thread_store(RedisStore(redis))
+    assert actual == expected, f"RedisStore diverged:\n{actual}\n!=\n{expected}"
+
+    expected = await _exercise_fact_store(FactStore())
+    actual = await _exercise_fact_store(RedisFactStore(redis))
+    assert actual == expected, f"RedisFactStore diverged:\n{actual}\n!=\n{expected}"
+    assert expected[1] is FactStatus.SAVED
+
+    fact_store = RedisFactStore(redis)
+    assert await redis.hlen(fact_store._facts_key) == await redis.zcard(fact_store._order_key)
+
+    await redis.aclose()
+    print("Redis stores match the in-memory stores.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())